@@ -2,12 +2,26 @@
 
 import csv
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 
+import numpy as np
 
-@dataclass
+try:
+    import cisv
+    CISV_AVAILABLE = True
+except ImportError:
+    CISV_AVAILABLE = False
+
+# Files above this size are worth parsing with cisv's parallel mode
+_PARALLEL_PARSE_THRESHOLD = 1024 * 1024  # 1 MB
+
+# Compiled once so the per-row hot path never re-parses the pattern
+_TRACK_ID_RE = re.compile(r'spotify\.com/track/([a-zA-Z0-9]+)')
+
+
+@dataclass(slots=True, frozen=True)
 class Song:
     """Represents a song with its metadata."""
     title: str
@@ -25,6 +39,51 @@ class Song:
         if not 1900 <= self.year <= 2100:
             raise ValueError(f"Year {self.year} is out of valid range (1900-2100)")
 
+    @classmethod
+    def unchecked(cls, title: str, artist: str, year: int,
+                  spotify_url: str, spotify_uri: str) -> 'Song':
+        """
+        Build a Song without running __post_init__ validation.
+
+        For callers (like load_songs) that have already validated the
+        fields - skips the duplicate checks on the per-row hot path.
+        """
+        song = cls.__new__(cls)
+        # object.__setattr__ because the dataclass is frozen
+        object.__setattr__(song, 'title', title)
+        object.__setattr__(song, 'artist', artist)
+        object.__setattr__(song, 'year', year)
+        object.__setattr__(song, 'spotify_url', spotify_url)
+        object.__setattr__(song, 'spotify_uri', spotify_uri)
+        return song
+
+
+@dataclass(slots=True)
+class SongTable:
+    """
+    Column-oriented (structure-of-arrays) storage for a deck of songs.
+
+    The PDF generator iterates these parallel columns directly, which is
+    cache-friendlier than chasing per-song attribute lookups. Indexing
+    and iteration still materialize Song objects for convenience.
+    """
+    titles: List[str] = field(default_factory=list)
+    artists: List[str] = field(default_factory=list)
+    years: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int16))
+    urls: List[str] = field(default_factory=list)
+    uris: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __getitem__(self, idx: int) -> Song:
+        return Song.unchecked(self.titles[idx], self.artists[idx],
+                              int(self.years[idx]), self.urls[idx], self.uris[idx])
+
+    def __iter__(self) -> Iterator[Song]:
+        for idx in range(len(self.titles)):
+            yield self[idx]
+
 
 def extract_spotify_track_id(url: str) -> str:
     """
@@ -38,13 +97,25 @@ def extract_spotify_track_id(url: str) -> str:
     # Handle spotify URI format
     if url.startswith("spotify:track:"):
         return url.split(":")[-1]
-    
-    # Handle URL format
-    pattern = r'spotify\.com/track/([a-zA-Z0-9]+)'
-    match = re.search(pattern, url)
+
+    # Fast path: plain string probe for the common URL shape, avoiding
+    # regex execution entirely. Anchored on the spotify.com host and
+    # restricted to ASCII alphanumerics so it accepts exactly what the
+    # regex below would
+    _, sep, tail = url.partition('spotify.com/track/')
+    if sep:
+        for pos, ch in enumerate(tail):
+            if ch in '?#/':
+                tail = tail[:pos]
+                break
+        if tail.isascii() and tail.isalnum():
+            return tail
+
+    # Fall back to regex for anything unusual
+    match = _TRACK_ID_RE.search(url)
     if match:
         return match.group(1)
-    
+
     raise ValueError(f"Could not extract Spotify track ID from: {url}")
 
 
@@ -54,70 +125,211 @@ def url_to_spotify_uri(url: str) -> str:
     return f"spotify:track:{track_id}"
 
 
-def load_songs(csv_path: Path) -> List[Song]:
+def _parse_rows(csv_path: Path) -> Tuple[List[str], List[List[str]], bool]:
+    """
+    Parse a CSV file into a header row and a list of data rows.
+
+    Uses cisv (a SIMD-accelerated C parser) when available - it parses the
+    whole file in one batch with the GIL released, which is 10-25x faster
+    than the stdlib for large playlists. Falls back to the stdlib csv module
+    otherwise.
+
+    Returns:
+        Tuple of (header fields, data rows as lists of strings, trimmed).
+        trimmed is True when the parser already stripped whitespace from
+        every field, so callers can skip their own .strip() pass.
+    """
+    if CISV_AVAILABLE:
+        parallel = csv_path.stat().st_size > _PARALLEL_PARSE_THRESHOLD
+        rows = cisv.parse_file(
+            str(csv_path),
+            trim=True,
+            skip_empty_lines=True,
+            parallel=parallel
+        )
+        if not rows:
+            raise ValueError("CSV file is empty or has no header row")
+        return rows[0], rows[1:], True
+
+    # Stdlib fallback
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        all_rows = [row for row in reader if row]
+
+    if not all_rows:
+        raise ValueError("CSV file is empty or has no header row")
+    return all_rows[0], all_rows[1:], False
+
+
+def _validate_row(row_num: int, title: str, artist: str, year_str: str,
+                  spotify_url: str) -> Tuple[int, str]:
+    """
+    Validate one CSV row's fields, returning (year, spotify_uri).
+
+    Raises ValueError with the row number on any invalid field.
+    """
+    if not title:
+        raise ValueError(f"Error in row {row_num}: Song title cannot be empty")
+    if not artist:
+        raise ValueError(f"Error in row {row_num}: Artist cannot be empty")
+
+    # isdecimal() fast path avoids a try/except for well-formed years
+    # (unlike isdigit(), it only accepts characters int() can parse)
+    if year_str.isdecimal():
+        year = int(year_str)
+    else:
+        raise ValueError(
+            f"Error in row {row_num}: Invalid year '{year_str}' - must be a number"
+        )
+    if not 1900 <= year <= 2100:
+        raise ValueError(
+            f"Error in row {row_num}: Year {year} is out of valid range (1900-2100)"
+        )
+
+    # Convert URL to URI - the one step that can genuinely fail
+    try:
+        spotify_uri = url_to_spotify_uri(spotify_url)
+    except ValueError as e:
+        raise ValueError(f"Error in row {row_num}: {e}")
+
+    return year, spotify_uri
+
+
+def iter_songs(csv_path: Path) -> Iterator[Song]:
+    """
+    Yield validated songs from a CSV file one at a time.
+
+    Unlike load_songs this never materializes the whole deck: on the
+    stdlib path rows are read incrementally, so memory stays bounded for
+    very large CSVs. (With cisv the parser returns all rows in one batch,
+    but Song objects are still produced lazily.)
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the CSV is malformed or contains invalid data
+    """
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    required_columns = {'title', 'artist', 'year', 'spotify_url'}
+
+    def rows_from_header(header, rows, trimmed):
+        missing_columns = required_columns - set(header)
+        if missing_columns:
+            raise ValueError(f"CSV is missing required columns: {missing_columns}")
+
+        col_idx = {name: idx for idx, name in enumerate(header)}
+        i_title = col_idx['title']
+        i_artist = col_idx['artist']
+        i_year = col_idx['year']
+        i_url = col_idx['spotify_url']
+        min_fields = max(i_title, i_artist, i_year, i_url) + 1
+
+        for row_num, row in enumerate(rows, start=2):
+            if len(row) < min_fields:
+                raise ValueError(
+                    f"Error in row {row_num}: expected at least {min_fields} "
+                    f"fields, got {len(row)}"
+                )
+            if trimmed:
+                fields = (row[i_title], row[i_artist], row[i_year], row[i_url])
+            else:
+                fields = (row[i_title].strip(), row[i_artist].strip(),
+                          row[i_year].strip(), row[i_url].strip())
+            title, artist, year_str, spotify_url = fields
+            year, spotify_uri = _validate_row(row_num, title, artist,
+                                              year_str, spotify_url)
+            yield Song.unchecked(title, artist, year, spotify_url, spotify_uri)
+
+    if CISV_AVAILABLE:
+        header, rows, trimmed = _parse_rows(csv_path)
+        yield from rows_from_header(header, rows, trimmed)
+        return
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty or has no header row")
+        yield from rows_from_header(header, (row for row in reader if row), False)
+
+
+def load_songs(csv_path: Path) -> SongTable:
     """
     Load songs from a CSV file.
-    
+
     Expected columns: title, artist, year, spotify_url
-    
+
     Args:
         csv_path: Path to the CSV file
-        
+
     Returns:
-        List of Song objects
-        
+        SongTable with the parsed songs in column-oriented form
+
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
         ValueError: If the CSV is malformed or contains invalid data
     """
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
-    
-    songs = []
+
     required_columns = {'title', 'artist', 'year', 'spotify_url'}
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        # Validate columns
-        if reader.fieldnames is None:
-            raise ValueError("CSV file is empty or has no header row")
-        
-        missing_columns = required_columns - set(reader.fieldnames)
-        if missing_columns:
-            raise ValueError(f"CSV is missing required columns: {missing_columns}")
-        
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-            try:
-                # Parse and validate the row
-                title = row['title'].strip()
-                artist = row['artist'].strip()
-                year_str = row['year'].strip()
-                spotify_url = row['spotify_url'].strip()
-                
-                # Validate year is a number
-                try:
-                    year = int(year_str)
-                except ValueError:
-                    raise ValueError(f"Invalid year '{year_str}' - must be a number")
-                
-                # Convert URL to URI
-                spotify_uri = url_to_spotify_uri(spotify_url)
-                
-                song = Song(
-                    title=title,
-                    artist=artist,
-                    year=year,
-                    spotify_url=spotify_url,
-                    spotify_uri=spotify_uri
-                )
-                songs.append(song)
-                
-            except Exception as e:
-                raise ValueError(f"Error in row {row_num}: {e}")
-    
-    if not songs:
+
+    header, rows, trimmed = _parse_rows(csv_path)
+
+    # Validate columns and build a name -> index map once, so the row loop
+    # can pull fields by position instead of a dict lookup per field
+    missing_columns = required_columns - set(header)
+    if missing_columns:
+        raise ValueError(f"CSV is missing required columns: {missing_columns}")
+
+    col_idx = {name: idx for idx, name in enumerate(header)}
+    i_title = col_idx['title']
+    i_artist = col_idx['artist']
+    i_year = col_idx['year']
+    i_url = col_idx['spotify_url']
+    min_fields = max(i_title, i_artist, i_year, i_url) + 1
+
+    titles: List[str] = []
+    artists: List[str] = []
+    years: List[int] = []
+    urls: List[str] = []
+    uris: List[str] = []
+
+    for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+        if len(row) < min_fields:
+            raise ValueError(
+                f"Error in row {row_num}: expected at least {min_fields} "
+                f"fields, got {len(row)}"
+            )
+        if trimmed:
+            # cisv already stripped every field - no transient strings
+            title = row[i_title]
+            artist = row[i_artist]
+            year_str = row[i_year]
+            spotify_url = row[i_url]
+        else:
+            title = row[i_title].strip()
+            artist = row[i_artist].strip()
+            year_str = row[i_year].strip()
+            spotify_url = row[i_url].strip()
+
+        year, spotify_uri = _validate_row(row_num, title, artist, year_str, spotify_url)
+
+        titles.append(title)
+        artists.append(artist)
+        years.append(year)
+        urls.append(spotify_url)
+        uris.append(spotify_uri)
+
+    if not titles:
         raise ValueError("CSV file contains no songs")
-    
-    return songs
+
+    return SongTable(
+        titles=titles,
+        artists=artists,
+        years=np.array(years, dtype=np.int16),
+        urls=urls,
+        uris=uris
+    )
 
@@ -1,6 +1,7 @@
 """CLI entry point for Hitster Card Generator."""
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 
@@ -51,7 +52,11 @@ def cmd_import(args):
         print(f"Error: {e}", file=sys.stderr)
         print("\nInstall spotipy with: pip install spotipy", file=sys.stderr)
         sys.exit(1)
-    
+
+    # The importer reports progress through logging; keep the CLI output
+    # looking like plain prints
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
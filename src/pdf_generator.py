@@ -1,19 +1,98 @@
 """PDF generator for printable double-sided cards with premium concentric circles design."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
+from itertools import islice
 from pathlib import Path
 from typing import List
 import math
 import random
 
+import numpy as np
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch, mm
 from reportlab.lib.colors import black, white, HexColor, Color
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen.pathobject import PDFPathObject
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
-from .csv_parser import Song
-from .qr_generator import generate_spotify_qr
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .csv_parser import SongTable
+from .qr_generator import get_qr_matrix
+
+
+class StateCachingCanvas(canvas.Canvas):
+    """
+    Canvas that drops redundant graphics-state operators.
+
+    The draw functions set stroke/fill colors, line widths and fonts per
+    card even when consecutive cards share the same values; this subclass
+    tracks the last-set value for each and only forwards real changes,
+    keeping the content stream free of no-op state churn. save/restore
+    and page breaks reset the tracking so skipped operators are always
+    genuinely redundant.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._gs_cache = {}
+        self._gs_stack = []
+        super().__init__(*args, **kwargs)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        key = ('stroke', aColor, alpha)
+        if self._gs_cache.get('stroke') == key:
+            return
+        self._gs_cache['stroke'] = key
+        super().setStrokeColor(aColor, alpha)
+
+    def setFillColor(self, aColor, alpha=None):
+        key = ('fill', aColor, alpha)
+        if self._gs_cache.get('fill') == key:
+            return
+        self._gs_cache['fill'] = key
+        super().setFillColor(aColor, alpha)
+
+    def setLineWidth(self, width):
+        if self._gs_cache.get('lw') == width:
+            return
+        self._gs_cache['lw'] = width
+        super().setLineWidth(width)
+
+    def setFont(self, psfontname, size, leading=None):
+        key = (psfontname, size, leading)
+        if self._gs_cache.get('font') == key:
+            return
+        self._gs_cache['font'] = key
+        super().setFont(psfontname, size, leading)
+
+    def saveState(self):
+        self._gs_stack.append(dict(self._gs_cache))
+        super().saveState()
+
+    def restoreState(self):
+        self._gs_cache = self._gs_stack.pop()
+        super().restoreState()
+
+    def showPage(self):
+        # A new page starts from the default graphics state
+        self._gs_cache = {}
+        self._gs_stack = []
+        super().showPage()
+
+    def beginForm(self, name, lowerx=0, lowery=0, upperx=None, uppery=None):
+        # Form content streams have their own graphics state
+        self._gs_cache = {}
+        super().beginForm(name, lowerx, lowery, upperx, uppery)
+
+    def endForm(self, **extra_attributes):
+        self._gs_cache = {}
+        super().endForm(**extra_attributes)
 
 
 # Card dimensions (square cards)
@@ -73,26 +152,59 @@ DECADE_THEMES = {
 }
 
 
+# Fonts and maximum widths for the text inside the back card's content
+# circle (radius 55; the chords at the title/artist baselines are ~106pt
+# and ~97pt, minus a little breathing room)
+_TITLE_FONT = ("Helvetica-Bold", 8)
+_ARTIST_FONT = ("Helvetica", 7)
+_TITLE_MAX_WIDTH = 98
+_ARTIST_MAX_WIDTH = 90
+
+
+@lru_cache(maxsize=8192)
+def _fit_text(text: str, font_name: str, font_size: float,
+              max_width: float) -> str:
+    """
+    Truncate text with an ellipsis so it fits max_width in the given font.
+
+    Measures with the real font metrics instead of counting characters,
+    so narrow and wide glyphs truncate fairly. Binary-searches the cut
+    point; memoized so repeated tracks measure once per process.
+    """
+    if stringWidth(text, font_name, font_size) <= max_width:
+        return text
+
+    budget = max_width - stringWidth("...", font_name, font_size)
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if stringWidth(text[:mid], font_name, font_size) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "..."
+
+
 def get_decade_theme(year: int) -> dict:
     """Get the color theme for a song based on its decade."""
-    if year >= 2020:
-        return DECADE_THEMES[2020]
-    elif year >= 2010:
-        return DECADE_THEMES[2010]
-    elif year >= 2000:
-        return DECADE_THEMES[2000]
-    elif year >= 1990:
-        return DECADE_THEMES[1990]
-    elif year >= 1980:
-        return DECADE_THEMES[1980]
-    elif year >= 1970:
-        return DECADE_THEMES[1970]
-    elif year >= 1960:
-        return DECADE_THEMES[1960]
-    elif year >= 1950:
-        return DECADE_THEMES[1950]
-    else:
+    if year < 1950:
         return DECADE_THEMES[0]
+    return DECADE_THEMES[min(year // 10 * 10, 2020)]
+
+
+def compute_themes(years) -> List[dict]:
+    """
+    Resolve decade themes for a whole list of years in one vectorized pass.
+
+    Clamps years to the 1950-2020 decade keys (pre-1950 maps to 0) with
+    NumPy instead of running the per-song branch ladder.
+    """
+    years_arr = np.asarray(years, dtype=np.int16)
+    decade_keys = np.where(
+        years_arr >= 2020, 2020,
+        np.where(years_arr < 1950, 0, (years_arr // 10) * 10)
+    )
+    return [DECADE_THEMES[int(k)] for k in decade_keys]
 
 # Vibrant CMYK-inspired colors for the concentric circles design
 CIRCLE_COLORS = [
@@ -107,6 +219,12 @@ CIRCLE_COLORS = [
 LIGHT_BG = HexColor("#f8f8f8")       # Off-white for front
 CARD_BORDER_LIGHT = HexColor("#e0e0e0")  # Light border
 
+# Text colors
+ARTIST_GRAY = HexColor("#666666")    # Artist line on the card back
+
+# Crop marks
+CROP_MARK_COLOR = HexColor("#9ca3af")
+
 
 def calculate_cards_per_page(page_width: float, page_height: float) -> tuple:
     """Calculate how many cards fit on a page."""
@@ -119,141 +237,336 @@ def calculate_cards_per_page(page_width: float, page_height: float) -> tuple:
     return cols, rows
 
 
-def draw_crop_marks(c: canvas.Canvas, x: float, y: float, length: float = 5*mm):
-    """Draw crop marks at card corners for cutting guide."""
-    c.setStrokeColor(HexColor("#9ca3af"))
+# Corner bits for crop-mark masks
+_CORNER_TL = 1
+_CORNER_TR = 2
+_CORNER_BL = 4
+_CORNER_BR = 8
+_ALL_CORNERS = _CORNER_TL | _CORNER_TR | _CORNER_BL | _CORNER_BR
+
+
+def _mirror_mask(mask: int) -> int:
+    """Mirror a corner mask horizontally (left corners swap with right)."""
+    mirrored = 0
+    if mask & _CORNER_TL:
+        mirrored |= _CORNER_TR
+    if mask & _CORNER_TR:
+        mirrored |= _CORNER_TL
+    if mask & _CORNER_BL:
+        mirrored |= _CORNER_BR
+    if mask & _CORNER_BR:
+        mirrored |= _CORNER_BL
+    return mirrored
+
+
+@lru_cache(maxsize=8)
+def _sheet_corner_masks(n: int, cols: int) -> tuple:
+    """
+    Corner masks for a sheet holding n cards in row-major order.
+
+    A corner only needs marks when it lies on the boundary of the
+    occupied region - interior corners are covered by the straight cuts
+    guided from that boundary. Deriving the boundary from the cards
+    actually present (not the full grid) keeps partial last sheets
+    correct: a lone card gets all four corners marked.
+
+    Returns (masks, mirrored_masks) for the front and back pages.
+    """
+    def occupied(r: int, c: int) -> bool:
+        return r >= 0 and 0 <= c < cols and r * cols + c < n
+
+    masks = []
+    for idx in range(n):
+        r, c = divmod(idx, cols)
+        mask = 0
+        # A corner is on the boundary unless all three cells sharing it
+        # are occupied too
+        if not (occupied(r - 1, c) and occupied(r, c - 1) and occupied(r - 1, c - 1)):
+            mask |= _CORNER_TL
+        if not (occupied(r - 1, c) and occupied(r, c + 1) and occupied(r - 1, c + 1)):
+            mask |= _CORNER_TR
+        if not (occupied(r + 1, c) and occupied(r, c - 1) and occupied(r + 1, c - 1)):
+            mask |= _CORNER_BL
+        if not (occupied(r + 1, c) and occupied(r, c + 1) and occupied(r + 1, c + 1)):
+            mask |= _CORNER_BR
+        masks.append(mask)
+
+    # The back page mirrors positions horizontally, so the occupied
+    # region (and with it every mask) mirrors the same way
+    return tuple(masks), tuple(_mirror_mask(m) for m in masks)
+
+
+def _ensure_crop_marks_form(c: canvas.Canvas, corner_mask: int,
+                            length: float = 5*mm) -> str:
+    """
+    Define the crop marks for one card position (restricted to the given
+    corners) as a Form XObject at the origin, once per canvas per mask.
+    Returns the form name.
+    """
+    name = f"cropmarks_{corner_mask}"
+    created = getattr(c, '_crop_marks_forms', None)
+    if created is None:
+        created = set()
+        c._crop_marks_forms = created
+    if name in created:
+        return name
+
+    corner_segments = (
+        (_CORNER_TL, ((-length, CARD_HEIGHT, -2, CARD_HEIGHT),
+                      (0, CARD_HEIGHT + 2, 0, CARD_HEIGHT + length))),
+        (_CORNER_TR, ((CARD_WIDTH + 2, CARD_HEIGHT, CARD_WIDTH + length, CARD_HEIGHT),
+                      (CARD_WIDTH, CARD_HEIGHT + 2, CARD_WIDTH, CARD_HEIGHT + length))),
+        (_CORNER_BL, ((-length, 0, -2, 0),
+                      (0, -2, 0, -length))),
+        (_CORNER_BR, ((CARD_WIDTH + 2, 0, CARD_WIDTH + length, 0),
+                      (CARD_WIDTH, -2, CARD_WIDTH, -length))),
+    )
+
+    c.beginForm(name, -length, -length, CARD_WIDTH + length, CARD_HEIGHT + length)
+    c.setStrokeColor(CROP_MARK_COLOR)
     c.setLineWidth(0.3)
-    
-    # Top-left
-    c.line(x - length, y + CARD_HEIGHT, x - 2, y + CARD_HEIGHT)
-    c.line(x, y + CARD_HEIGHT + 2, x, y + CARD_HEIGHT + length)
-    
-    # Top-right
-    c.line(x + CARD_WIDTH + 2, y + CARD_HEIGHT, x + CARD_WIDTH + length, y + CARD_HEIGHT)
-    c.line(x + CARD_WIDTH, y + CARD_HEIGHT + 2, x + CARD_WIDTH, y + CARD_HEIGHT + length)
-    
-    # Bottom-left
-    c.line(x - length, y, x - 2, y)
-    c.line(x, y - 2, x, y - length)
-    
-    # Bottom-right
-    c.line(x + CARD_WIDTH + 2, y, x + CARD_WIDTH + length, y)
-    c.line(x + CARD_WIDTH, y - 2, x + CARD_WIDTH, y - length)
+
+    # All selected marks in one path, stroked once
+    path = c.beginPath()
+    for bit, segments in corner_segments:
+        if corner_mask & bit:
+            for x1, y1, x2, y2 in segments:
+                path.moveTo(x1, y1)
+                path.lineTo(x2, y2)
+    c.drawPath(path, stroke=1, fill=0)
+
+    c.endForm()
+    created.add(name)
+    return name
+
+
+def draw_crop_marks(c: canvas.Canvas, x: float, y: float, length: float = 5*mm,
+                    corner_mask: int = _ALL_CORNERS):
+    """Draw crop marks at card corners for cutting guide."""
+    if not corner_mask:
+        return
+    form_name = _ensure_crop_marks_form(c, corner_mask, length)
+    c.saveState()
+    c.translate(x, y)
+    c.doForm(form_name)
+    c.restoreState()
+
+
+def _unit_circle_tables(n: int) -> tuple:
+    """Return (cos_array, sin_array) for n evenly spaced angles, cached per n."""
+    tables = _TRIG_TABLE_CACHE.get(n)
+    if tables is None:
+        angles = np.arange(n) * (2 * math.pi / n)
+        tables = (np.cos(angles), np.sin(angles))
+        _TRIG_TABLE_CACHE[n] = tables
+    return tables
+
+
+# Trig tables for the default starburst (48 lines) and rosette (6 petals),
+# computed once at import so the per-card loops are pure multiply-adds
+_TRIG_TABLE_CACHE = {}
+_STARBURST_COS_48, _STARBURST_SIN_48 = _unit_circle_tables(48)
+_ROSETTE_COS_6, _ROSETTE_SIN_6 = _unit_circle_tables(6)
 
 
 def draw_corner_rosette(c: canvas.Canvas, cx: float, cy: float, radius: float, color: Color):
     """Draw a decorative rosette/flower pattern at the given center point."""
     c.setStrokeColor(color)
     c.setLineWidth(0.8)
-    
+
+    # All 8 circles (outer, 6 petals, center dot) go into one path so the
+    # rosette is stroked with a single operation
+    path = c.beginPath()
+
     # Outer circle
-    c.circle(cx, cy, radius, stroke=1, fill=0)
-    
+    path.circle(cx, cy, radius)
+
     # Inner decorative pattern - small circles around center
     inner_radius = radius * 0.4
-    num_petals = 6
-    for i in range(num_petals):
-        angle = (i * 360 / num_petals) * math.pi / 180
-        petal_x = cx + inner_radius * math.cos(angle)
-        petal_y = cy + inner_radius * math.sin(angle)
-        c.circle(petal_x, petal_y, radius * 0.2, stroke=1, fill=0)
-    
+    petal_radius = radius * 0.2
+    for cos_a, sin_a in zip(_ROSETTE_COS_6, _ROSETTE_SIN_6):
+        path.circle(cx + inner_radius * cos_a, cy + inner_radius * sin_a,
+                    petal_radius)
+
     # Center dot
-    c.circle(cx, cy, radius * 0.15, stroke=1, fill=0)
+    path.circle(cx, cy, radius * 0.15)
+
+    c.drawPath(path, stroke=1, fill=0)
 
 
-def draw_starburst_lines(c: canvas.Canvas, cx: float, cy: float, 
-                         inner_radius: float, outer_radius: float, 
+def draw_starburst_lines(c: canvas.Canvas, cx: float, cy: float,
+                         inner_radius: float, outer_radius: float,
                          color: Color, num_lines: int = 48):
     """Draw radiating starburst lines from center."""
     c.setStrokeColor(color)
     c.setLineWidth(0.6)
-    
+
+    # Endpoints come from one broadcast NumPy computation; the loop only
+    # appends to the single path, stroked once at the end
+    cos_table, sin_table = _unit_circle_tables(num_lines)
+    x1 = cx + inner_radius * cos_table
+    y1 = cy + inner_radius * sin_table
+    x2 = cx + outer_radius * cos_table
+    y2 = cy + outer_radius * sin_table
+
+    path = c.beginPath()
     for i in range(num_lines):
-        angle = (i * 360 / num_lines) * math.pi / 180
-        
-        # Start point (inner)
-        x1 = cx + inner_radius * math.cos(angle)
-        y1 = cy + inner_radius * math.sin(angle)
-        
-        # End point (outer)
-        x2 = cx + outer_radius * math.cos(angle)
-        y2 = cy + outer_radius * math.sin(angle)
-        
-        c.line(x1, y1, x2, y2)
-
-
-def draw_broken_arc(c: canvas.Canvas, cx: float, cy: float, radius: float, 
-                    start_angle: float, extent: float, color: Color, line_width: float = 1.0):
-    """Draw a single arc segment."""
-    c.setStrokeColor(color)
-    c.setLineWidth(line_width)
-    
-    # ReportLab arc uses bounding box coordinates
-    x1 = cx - radius
-    y1 = cy - radius
-    x2 = cx + radius
-    y2 = cy + radius
-    
-    c.arc(x1, y1, x2, y2, start_angle, extent)
+        path.moveTo(x1[i], y1[i])
+        path.lineTo(x2[i], y2[i])
+    c.drawPath(path, stroke=1, fill=0)
 
 
-def draw_concentric_broken_circles(c: canvas.Canvas, cx: float, cy: float, 
-                                   min_radius: float, max_radius: float,
-                                   colors: list, seed: int = None):
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _compute_arc_array(seed, min_radius, max_radius, num_colors):  # pragma: no cover
+        """
+        Numba kernel filling a preallocated (radius, start, extent,
+        color_idx, line_width) array for one card's arc geometry.
+        """
+        np.random.seed(seed)
+
+        total_range = max_radius - min_radius
+        layer_size = total_range / 3.0
+        starts = (min_radius, min_radius + layer_size, min_radius + 2 * layer_size)
+        ends = (min_radius + layer_size, min_radius + 2 * layer_size, max_radius)
+        spacings = (8.0, 7.0, 6.0)
+        widths = (0.8, 1.0, 1.2)
+
+        # Worst case: every ring gets the maximum 6 segments
+        max_arcs = 0
+        for i in range(3):
+            max_arcs += int((ends[i] - starts[i]) / spacings[i]) * 6
+        out = np.empty((max_arcs, 5), dtype=np.float32)
+
+        n = 0
+        for layer_idx in range(3):
+            num_rings = int((ends[layer_idx] - starts[layer_idx]) / spacings[layer_idx])
+            for ring_idx in range(num_rings):
+                radius = starts[layer_idx] + ring_idx * spacings[layer_idx] + 3.0
+                num_segments = np.random.randint(3, 7)
+                total_arc_degrees = np.random.randint(240, 321)
+                gap_degrees = (360.0 - total_arc_degrees) / num_segments
+                current_angle = float(np.random.randint(0, 361))
+
+                for seg_idx in range(num_segments):
+                    arc_extent = total_arc_degrees / num_segments + np.random.randint(-20, 21)
+                    arc_extent = max(20.0, min(120.0, arc_extent))
+
+                    out[n, 0] = radius
+                    out[n, 1] = current_angle
+                    out[n, 2] = arc_extent
+                    out[n, 3] = (layer_idx + ring_idx + seg_idx) % num_colors
+                    out[n, 4] = widths[layer_idx] + (ring_idx % 2) * 0.15
+                    n += 1
+
+                    current_angle += arc_extent + gap_degrees + np.random.randint(-10, 11)
+
+        return out[:n]
+
+
+@lru_cache(maxsize=2048)
+def _compute_circle_ops(seed: int, min_radius: float, max_radius: float,
+                        num_colors: int) -> tuple:
     """
-    Draw concentric broken/segmented circles in vibrant colors.
-    Creates the signature HITSTER card design with three distinct layers.
+    Compute the arc geometry for one card's concentric broken circles.
+
+    Pure function of (seed, radii, palette size), so results are memoized -
+    repeated seeds skip the random walk entirely. Returns a tuple of
+    (radius, start_angle, extent, color_idx, line_width) ops for the
+    drawing code to replay.
+
+    When numba is installed the geometry comes from a jitted kernel that
+    uses NumPy's RNG; patterns stay deterministic per seed but differ
+    from the pure-Python stream.
     """
-    if seed is not None:
-        random.seed(seed)
-    
+    if NUMBA_AVAILABLE:
+        arr = _compute_arc_array(seed, min_radius, max_radius, num_colors)
+        return tuple(
+            (float(r), float(s), float(e), int(ci), round(float(lw), 2))
+            for r, s, e, ci, lw in arr
+        )
+
+    rng = random.Random(seed)
+    ops = []
+
     # Three layer configuration - inner, middle, outer
     total_range = max_radius - min_radius
     layer_size = total_range / 3
-    
+
     layers = [
         {"start": min_radius, "end": min_radius + layer_size, "spacing": 8, "line_width": 0.8},
         {"start": min_radius + layer_size, "end": min_radius + 2 * layer_size, "spacing": 7, "line_width": 1.0},
         {"start": min_radius + 2 * layer_size, "end": max_radius, "spacing": 6, "line_width": 1.2},
     ]
-    
+
     for layer_idx, layer in enumerate(layers):
         layer_start = layer["start"]
         layer_end = layer["end"]
         ring_spacing = layer["spacing"]
         base_line_width = layer["line_width"]
-        
+
         num_rings = int((layer_end - layer_start) / ring_spacing)
-        
+
         for ring_idx in range(num_rings):
             radius = layer_start + (ring_idx * ring_spacing) + 3
-            
+
             # Each ring has multiple arcs with gaps
-            num_segments = random.randint(3, 6)
-            
+            num_segments = rng.randint(3, 6)
+
             # Calculate arc positions - leave gaps between arcs
-            total_arc_degrees = random.randint(240, 320)
+            total_arc_degrees = rng.randint(240, 320)
             gap_degrees = (360 - total_arc_degrees) / num_segments
-            
+
             # Random starting position for variety
-            current_angle = random.randint(0, 360)
-            
+            current_angle = rng.randint(0, 360)
+
             for seg_idx in range(num_segments):
                 # Arc extent varies
-                arc_extent = total_arc_degrees / num_segments + random.randint(-20, 20)
+                arc_extent = total_arc_degrees / num_segments + rng.randint(-20, 20)
                 arc_extent = max(20, min(120, arc_extent))
-                
+
                 # Pick a color - alternate and vary
-                color = colors[(layer_idx + ring_idx + seg_idx) % len(colors)]
-                
+                color_idx = (layer_idx + ring_idx + seg_idx) % num_colors
+
                 # Slight variation in line width within layer
                 line_width = base_line_width + (ring_idx % 2) * 0.15
-                
-                draw_broken_arc(c, cx, cy, radius, current_angle, arc_extent, color, line_width)
-                
+
+                ops.append((radius, current_angle, arc_extent, color_idx, line_width))
+
                 # Move to next position (arc extent + gap)
-                current_angle += arc_extent + gap_degrees + random.randint(-10, 10)
+                current_angle += arc_extent + gap_degrees + rng.randint(-10, 10)
+
+    return tuple(ops)
+
+
+def draw_concentric_broken_circles(c: canvas.Canvas, cx: float, cy: float,
+                                   min_radius: float, max_radius: float,
+                                   colors: list, seed: int = 0):
+    """
+    Draw concentric broken/segmented circles in vibrant colors.
+    Creates the signature HITSTER card design with three distinct layers.
+    """
+    ops = _compute_circle_ops(seed, round(min_radius, 2), round(max_radius, 2),
+                              len(colors))
+
+    # Group arcs by stroke state so each (color, width) group becomes a
+    # single path stroked once, instead of one stroke op per arc
+    ops = sorted(ops, key=lambda op: (op[3], op[4]))
+
+    group_key = None
+    path = None
+    for radius, start_angle, extent, color_idx, line_width in ops:
+        if (color_idx, line_width) != group_key:
+            if path is not None:
+                c.drawPath(path, stroke=1, fill=0)
+            c.setStrokeColor(colors[color_idx])
+            c.setLineWidth(line_width)
+            path = c.beginPath()
+            group_key = (color_idx, line_width)
+        path.arc(cx - radius, cy - radius, cx + radius, cy + radius,
+                 start_angle, extent)
+    if path is not None:
+        c.drawPath(path, stroke=1, fill=0)
 
 
 def draw_inner_border(c: canvas.Canvas, x: float, y: float, color: Color, padding: float = 8):
@@ -269,183 +582,434 @@ def draw_inner_border(c: canvas.Canvas, x: float, y: float, color: Color, paddin
     c.rect(border_x, border_y, border_width, border_height, stroke=1, fill=0)
 
 
-def draw_qr_front(c: canvas.Canvas, x: float, y: float, song: Song, card_num: int, theme: dict):
+# QR code size on the card front
+QR_SIZE = int(CARD_WIDTH * 0.50)
+
+# Below this many unique URIs, process-pool startup costs more than it saves
+_PARALLEL_QR_THRESHOLD = 32
+
+
+# QR module matrices already computed, keyed by URI and kept for the life
+# of the process so repeated generate runs (and every card sharing a URI)
+# reuse them
+_QR_MATRIX_CACHE = {}
+
+
+def build_qr_matrices(uris) -> dict:
+    """
+    Precompute the QR module matrix for every unique Spotify URI in the deck.
+
+    Each URI's matrix is computed exactly once and reused for every card
+    carrying that URI - duplicate tracks cost nothing beyond the first
+    encode. Large decks spread the CPU-bound QR encoding across all cores
+    with a process pool (matrices are plain tuples, so they pickle
+    cheaply); the canvas drawing itself stays on the main thread.
+
+    Args:
+        uris: Iterable of spotify URIs (duplicates allowed)
+
+    Returns:
+        Dict mapping spotify_uri -> module matrix (see get_qr_matrix)
+    """
+    unique_uris = list(dict.fromkeys(uris))
+    missing = [uri for uri in unique_uris if uri not in _QR_MATRIX_CACHE]
+
+    if len(missing) >= _PARALLEL_QR_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            for uri, matrix in zip(missing, executor.map(get_qr_matrix, missing,
+                                                         chunksize=16)):
+                _QR_MATRIX_CACHE[uri] = matrix
+    else:
+        for uri in missing:
+            _QR_MATRIX_CACHE[uri] = get_qr_matrix(uri)
+
+    return {uri: _QR_MATRIX_CACHE[uri] for uri in unique_uris}
+
+
+# Prebuilt vector paths keyed by QR matrix. A PDFPathObject is a plain
+# operator buffer with no canvas binding, so one path can be replayed by
+# drawPath on any canvas
+_QR_PATH_CACHE = {}
+
+
+def _qr_path(qr_matrix: tuple) -> PDFPathObject:
+    """
+    Build the filled-rect path for a QR matrix, once per unique matrix.
+
+    Horizontal runs of adjacent dark modules are merged into single
+    rectangles, cutting the rect count roughly in half versus one rect
+    per module. Coordinates are QR-local (origin at the code's lower-left
+    corner, QR_SIZE points square); callers translate into place and
+    replay the cached path with a single drawPath per card.
+    """
+    path = _QR_PATH_CACHE.get(qr_matrix)
+    if path is not None:
+        return path
+
+    n = len(qr_matrix)
+    box = QR_SIZE / n
+
+    path = PDFPathObject()
+    for row_idx, row in enumerate(qr_matrix):
+        # Matrix rows run top-down; PDF y runs bottom-up
+        ry = QR_SIZE - (row_idx + 1) * box
+        col = 0
+        while col < n:
+            if row[col]:
+                run_start = col
+                while col < n and row[col]:
+                    col += 1
+                path.rect(run_start * box, ry, (col - run_start) * box, box)
+            else:
+                col += 1
+
+    _QR_PATH_CACHE[qr_matrix] = path
+    return path
+
+
+def _ensure_front_bg_form(c: canvas.Canvas) -> str:
+    """
+    Define the front card's static chrome (the solid black background) as
+    a Form XObject at the origin, once per canvas. Returns the form name.
+    """
+    name = "card_front_bg"
+    if getattr(c, '_has_front_bg_form', False):
+        return name
+
+    c.beginForm(name, 0, 0, CARD_WIDTH, CARD_HEIGHT)
+    c.setFillColor(black)
+    c.setStrokeColor(black)
+    c.rect(0, 0, CARD_WIDTH, CARD_HEIGHT, stroke=1, fill=1)
+    c.endForm()
+    c._has_front_bg_form = True
+    return name
+
+
+def draw_qr_front(c: canvas.Canvas, x: float, y: float, card_num: int,
+                  theme: dict, qr_matrix: tuple):
     """Draw the front of a card (QR code side) with concentric broken circles design on black background."""
     # Card center
     cx = x + CARD_WIDTH / 2
     cy = y + CARD_HEIGHT / 2
-    
-    # Draw solid black background
-    c.setFillColor(black)
-    c.setStrokeColor(black)
-    c.rect(x, y, CARD_WIDTH, CARD_HEIGHT, stroke=1, fill=1)
-    
-    # QR code size
-    qr_size = int(CARD_WIDTH * 0.50)
-    
+
+    # Solid black background - static chrome shared across every front
+    # card via one Form XObject
+    form_name = _ensure_front_bg_form(c)
+    c.saveState()
+    c.translate(x, y)
+    c.doForm(form_name)
+    c.restoreState()
+
     # Draw concentric broken circles around the QR code area
-    min_radius = qr_size / 2 + 8  # Start just outside QR code
+    min_radius = QR_SIZE / 2 + 8  # Start just outside QR code
     max_radius = min(CARD_WIDTH, CARD_HEIGHT) / 2 - 5  # Leave small margin from edge
-    
+
     # Use card_num as seed for reproducible but varied patterns
     draw_concentric_broken_circles(c, cx, cy, min_radius, max_radius, CIRCLE_COLORS, seed=card_num)
-    
-    # Generate white QR code on transparent background
-    qr_img = generate_spotify_qr(song.spotify_uri, size=qr_size, inverted=True)
-    
-    # Convert PIL image to reportlab-compatible format
-    img_buffer = BytesIO()
-    qr_img.save(img_buffer, format='PNG')
-    img_buffer.seek(0)
-    qr_reader = ImageReader(img_buffer)
-    
-    # Draw QR code centered (directly on black background)
-    qr_x = cx - qr_size / 2
-    qr_y = cy - qr_size / 2
-    c.drawImage(qr_reader, qr_x, qr_y, width=qr_size, height=qr_size, mask='auto')
 
+    # Draw QR code centered as vector rectangles - white modules straight
+    # onto the black background. No raster image, no PNG encode, and the
+    # code stays sharp at any print resolution. The path itself is built
+    # once per unique matrix and replayed here.
+    qr_x = cx - QR_SIZE / 2
+    qr_y = cy - QR_SIZE / 2
+
+    c.saveState()
+    c.translate(qr_x, qr_y)
+    c.setFillColor(white)
+    c.drawPath(_qr_path(qr_matrix), stroke=0, fill=1)
+    c.restoreState()
+
+
+def _ensure_rosette_form(c: canvas.Canvas, color: Color, radius: float = 6) -> str:
+    """
+    Define a corner rosette in the given color as a Form XObject centered
+    at the origin, once per canvas. Returns the form name.
+    """
+    name = f"rosette_{color.hexval()[2:]}"
+    created = getattr(c, '_rosette_forms', None)
+    if created is None:
+        created = set()
+        c._rosette_forms = created
+    if name not in created:
+        c.beginForm(name, -radius - 1, -radius - 1, radius + 1, radius + 1)
+        draw_corner_rosette(c, 0, 0, radius, color)
+        c.endForm()
+        created.add(name)
+    return name
+
+
+def _ensure_ornament_form(c: canvas.Canvas, theme: dict) -> str:
+    """
+    Define the theme's static back-side ornament (starburst, inner border,
+    four rosettes) as a Form XObject, once per canvas.
+
+    Every card back of the same decade then references the form with a
+    single Do operator instead of re-emitting the full decoration, so the
+    ornament's path data appears once in the PDF per theme.
+
+    Returns:
+        The form name to pass to doForm.
+    """
+    name = f"ornament_{theme['name']}"
+    created = getattr(c, '_ornament_forms', None)
+    if created is None:
+        created = set()
+        c._ornament_forms = created
+    if name in created:
+        return name
 
-def draw_song_back(c: canvas.Canvas, x: float, y: float, song: Song, card_num: int, theme: dict):
-    """Draw the back of a card (song details side) with starburst design - ink-saving outline version."""
-    primary_color = theme["primary"]
     light_accent = theme["light_accent"]
-    
-    # Card center
-    cx = x + CARD_WIDTH / 2
-    cy = y + CARD_HEIGHT / 2
-    
-    # Draw starburst lines in theme color (no filled background)
+    cx = CARD_WIDTH / 2
+    cy = CARD_HEIGHT / 2
+
+    # The rosette is its own (nested) form so its 8 circles are defined
+    # once per color and referenced from the four corners
+    rosette_form = _ensure_rosette_form(c, light_accent)
+
+    c.beginForm(name, 0, 0, CARD_WIDTH, CARD_HEIGHT)
+
+    # Starburst lines in theme color (no filled background)
     inner_radius = 45
     outer_radius = min(CARD_WIDTH, CARD_HEIGHT) / 2 - 15
-    
     draw_starburst_lines(c, cx, cy, inner_radius, outer_radius, light_accent, num_lines=48)
-    
-    # Draw inner border in theme color
-    c.setStrokeColor(light_accent)
-    c.setLineWidth(1.2)
-    padding = 8
-    c.rect(x + padding, y + padding, CARD_WIDTH - 2*padding, CARD_HEIGHT - 2*padding, stroke=1, fill=0)
-    
-    # Draw corner rosettes in theme color
-    rosette_radius = 6
+
+    # Inner border in theme color
+    draw_inner_border(c, 0, 0, light_accent)
+
+    # Corner rosettes in theme color, one Do per corner
     corner_offset = 18
-    
-    draw_corner_rosette(c, x + corner_offset, y + CARD_HEIGHT - corner_offset, rosette_radius, light_accent)
-    draw_corner_rosette(c, x + CARD_WIDTH - corner_offset, y + CARD_HEIGHT - corner_offset, rosette_radius, light_accent)
-    draw_corner_rosette(c, x + corner_offset, y + corner_offset, rosette_radius, light_accent)
-    draw_corner_rosette(c, x + CARD_WIDTH - corner_offset, y + corner_offset, rosette_radius, light_accent)
-    
-    # Central content area - white circle with colored border
+    for rx, ry in ((corner_offset, CARD_HEIGHT - corner_offset),
+                   (CARD_WIDTH - corner_offset, CARD_HEIGHT - corner_offset),
+                   (corner_offset, corner_offset),
+                   (CARD_WIDTH - corner_offset, corner_offset)):
+        c.saveState()
+        c.translate(rx, ry)
+        c.doForm(rosette_form)
+        c.restoreState()
+
+    # Central content area - white circle with colored ring (static per
+    # theme, so it lives in the form too; text is drawn over it per card)
     content_radius = 55
     c.setFillColor(white)
     c.circle(cx, cy, content_radius, stroke=0, fill=1)
-    
-    # Colored ring around content
-    c.setStrokeColor(primary_color)
+    c.setStrokeColor(theme["primary"])
     c.setLineWidth(2)
     c.circle(cx, cy, content_radius, stroke=1, fill=0)
-    
+
+    c.endForm()
+    created.add(name)
+    return name
+
+
+def draw_song_back(c: canvas.Canvas, x: float, y: float, year: int, title: str,
+                   artist: str, card_num: int, theme: dict):
+    """Draw the back of a card (song details side) with starburst design - ink-saving outline version."""
+    draw_song_back_frame(c, x, y, theme)
+    draw_song_back_text(c, x, y, year, title, artist, theme)
+
+
+def draw_song_back_frame(c: canvas.Canvas, x: float, y: float, theme: dict):
+    """Draw the static part of a card back: ornament form and outer border."""
+    # Static decoration (starburst, inner border, rosettes, content
+    # circle) comes from the theme's Form XObject - one Do operator per card
+    form_name = _ensure_ornament_form(c, theme)
+    c.saveState()
+    c.translate(x, y)
+    c.doForm(form_name)
+    c.restoreState()
+
+    # Outer card border in theme color
+    c.setStrokeColor(theme["primary"])
+    c.setLineWidth(1.5)
+    c.rect(x, y, CARD_WIDTH, CARD_HEIGHT, stroke=1, fill=0)
+
+
+def draw_song_back_text(c: canvas.Canvas, x: float, y: float, year: int,
+                        title: str, artist: str, theme: dict):
+    """Draw a card back's dynamic text: year, title and artist."""
+    cx = x + CARD_WIDTH / 2
+    year_y = y + CARD_HEIGHT / 2 + 8
+
     # Year - large and prominent
-    c.setFillColor(primary_color)
+    c.setFillColor(theme["primary"])
     c.setFont("Helvetica-Bold", 32)
-    year_y = cy + 8
-    c.drawCentredString(cx, year_y, str(song.year))
-    
-    # Song title - below year
-    c.setFont("Helvetica-Bold", 8)
-    title = song.title
-    if len(title) > 20:
-        title = title[:17] + "..."
+    c.drawCentredString(cx, year_y, str(year))
+
+    # Song title - below year (already truncated to fit)
+    c.setFont(*_TITLE_FONT)
     c.drawCentredString(cx, year_y - 22, title)
-    
-    # Artist - below title
-    c.setFont("Helvetica", 7)
-    c.setFillColor(HexColor("#666666"))
-    artist = song.artist
-    if len(artist) > 22:
-        artist = artist[:19] + "..."
+
+    # Artist - below title (already truncated to fit)
+    c.setFont(*_ARTIST_FONT)
+    c.setFillColor(ARTIST_GRAY)
     c.drawCentredString(cx, year_y - 34, artist)
-    
-    # Outer card border in theme color
-    c.setStrokeColor(primary_color)
-    c.setLineWidth(1.5)
-    c.rect(x, y, CARD_WIDTH, CARD_HEIGHT, stroke=1, fill=0)
 
 
-def generate_cards_pdf(songs: List[Song], output_path: Path):
+def _draw_sheet(c: canvas.Canvas, grid, batch_start: int, years, titles, artists,
+                themes, matrices):
+    """
+    Draw one sheet of paper: a front page of QR codes followed by the
+    horizontally mirrored back page of song details.
+
+    All sequence arguments are batch-local (index 0 = first card on the
+    sheet); batch_start is the card's offset in the whole deck.
+    """
+    xs, ys, xs_mirror, cols = grid
+    n = len(titles)
+
+    # Crop-mark corners depend on which positions this sheet actually
+    # fills, so a partial last sheet still marks every cut line
+    masks, masks_mirror = _sheet_corner_masks(n, cols)
+
+    # === FRONT PAGE (QR codes) ===
+    for idx in range(n):
+        x = float(xs[idx])
+        y = float(ys[idx])
+
+        draw_crop_marks(c, x, y, corner_mask=masks[idx])
+        draw_qr_front(c, x, y, batch_start + idx + 1, themes[idx], matrices[idx])
+
+    c.showPage()
+
+    # === BACK PAGE (Song details) ===
+    # Mirror horizontally for double-sided printing. Fields are drawn in
+    # style-ordered passes - all frames, then all years, then all titles,
+    # then all artists - so font and color switches happen a few times
+    # per page rather than several times per card.
+    cxs = [float(xs_mirror[idx]) + CARD_WIDTH / 2 for idx in range(n)]
+    year_ys = [float(ys[idx]) + CARD_HEIGHT / 2 + 8 for idx in range(n)]
+
+    for idx in range(n):
+        x = float(xs_mirror[idx])
+        y = float(ys[idx])
+        draw_crop_marks(c, x, y, corner_mask=masks_mirror[idx])
+        draw_song_back_frame(c, x, y, themes[idx])
+
+    c.setFont("Helvetica-Bold", 32)
+    for idx in range(n):
+        c.setFillColor(themes[idx]["primary"])
+        c.drawCentredString(cxs[idx], year_ys[idx], str(int(years[idx])))
+
+    c.setFont(*_TITLE_FONT)
+    for idx in range(n):
+        c.setFillColor(themes[idx]["primary"])
+        c.drawCentredString(cxs[idx], year_ys[idx] - 22, titles[idx])
+
+    c.setFont(*_ARTIST_FONT)
+    c.setFillColor(ARTIST_GRAY)
+    for idx in range(n):
+        c.drawCentredString(cxs[idx], year_ys[idx] - 34, artists[idx])
+
+    c.showPage()
+
+
+def generate_cards_pdf(songs, output_path: Path):
     """
     Generate a PDF with printable double-sided cards.
-    
+
     The PDF alternates between front pages (QR codes) and back pages (song details).
     Cards on back pages are mirrored horizontally so they align when printed double-sided.
-    
+
     Args:
-        songs: List of Song objects to generate cards for
+        songs: SongTable with the deck to generate cards for, or any
+            iterable of Song objects. An iterable is consumed lazily one
+            sheet at a time, so peak memory stays O(cards_per_page) even
+            for very large decks.
         output_path: Path where the PDF will be saved
     """
     page_width, page_height = A4
     cols, rows = calculate_cards_per_page(page_width, page_height)
     cards_per_page = cols * rows
-    
-    # Create PDF
-    c = canvas.Canvas(str(output_path), pagesize=A4)
-    
+
+    # Build the PDF in memory and flush to disk with one write at the end,
+    # instead of streaming many small writes through the canvas
+    # pageCompression zlib-compresses the repetitive vector content
+    # streams; invariant drops per-run timestamps so identical decks
+    # produce byte-identical PDFs
+    pdf_buffer = BytesIO()
+    c = StateCachingCanvas(pdf_buffer, pagesize=A4, pageCompression=1, invariant=1)
+
     # Calculate starting position (centered on page)
     total_cards_width = cols * CARD_WIDTH
     total_cards_height = rows * CARD_HEIGHT
     start_x = (page_width - total_cards_width) / 2
     start_y = (page_height - total_cards_height) / 2
-    
-    total_songs = len(songs)
-    
-    # Process songs in batches (one batch = one sheet of paper, front and back)
-    for batch_start in range(0, len(songs), cards_per_page):
-        batch = songs[batch_start:batch_start + cards_per_page]
-        
-        # Progress indicator
-        progress = min(batch_start + cards_per_page, total_songs)
-        print(f"  Generating cards {batch_start + 1}-{progress} of {total_songs}...")
-        
-        # === FRONT PAGE (QR codes) ===
-        for idx, song in enumerate(batch):
-            row = idx // cols
-            col = idx % cols
-            
-            # Position from bottom-left
-            x = start_x + (col * CARD_WIDTH)
-            y = start_y + ((rows - 1 - row) * CARD_HEIGHT)  # Top to bottom
-            
-            card_num = batch_start + idx + 1
-            # Get theme based on song's decade
-            theme = get_decade_theme(song.year)
-            
-            draw_crop_marks(c, x, y)
-            draw_qr_front(c, x, y, song, card_num, theme)
-        
-        c.showPage()
-        
-        # === BACK PAGE (Song details) ===
-        # Mirror horizontally for double-sided printing
-        for idx, song in enumerate(batch):
-            row = idx // cols
-            col = idx % cols
-            
-            # Mirror column position for double-sided printing
-            mirrored_col = cols - 1 - col
-            
-            x = start_x + (mirrored_col * CARD_WIDTH)
-            y = start_y + ((rows - 1 - row) * CARD_HEIGHT)
-            
-            card_num = batch_start + idx + 1
-            # Use same theme based on song's decade
-            theme = get_decade_theme(song.year)
-            
-            draw_crop_marks(c, x, y)
-            draw_song_back(c, x, y, song, card_num, theme)
-        
-        c.showPage()
-    
+
+    # Card positions repeat identically on every sheet - compute the grid
+    # (and its mirrored back-side variant) once instead of per card
+    idxs = np.arange(cards_per_page)
+    rows_arr = idxs // cols
+    cols_arr = idxs % cols
+    xs = start_x + cols_arr * CARD_WIDTH
+    ys = start_y + (rows - 1 - rows_arr) * CARD_HEIGHT  # Top to bottom
+    xs_mirror = start_x + (cols - 1 - cols_arr) * CARD_WIDTH
+    grid = (xs, ys, xs_mirror, cols)
+
+    if isinstance(songs, SongTable):
+        total_songs = len(songs)
+
+        # Full deck in memory: precompute everything in one pass
+        titles = songs.titles
+        artists = songs.artists
+        years = songs.years
+        uris = songs.uris
+
+        # Resolve all decade themes in one vectorized pass up front
+        themes = compute_themes(years)
+
+        # Truncate titles/artists for display once, outside the draw loop
+        display_titles = [_fit_text(t, *_TITLE_FONT, _TITLE_MAX_WIDTH)
+                          for t in titles]
+        display_artists = [_fit_text(a, *_ARTIST_FONT, _ARTIST_MAX_WIDTH)
+                           for a in artists]
+
+        # Compute each unique QR matrix once, reused across duplicate tracks
+        qr_matrices = build_qr_matrices(uris)
+
+        for batch_start in range(0, total_songs, cards_per_page):
+            batch_end = min(batch_start + cards_per_page, total_songs)
+            print(f"  Generating cards {batch_start + 1}-{batch_end} of {total_songs}...")
+
+            sl = slice(batch_start, batch_end)
+            _draw_sheet(c, grid, batch_start, years[sl], display_titles[sl],
+                        display_artists[sl], themes[sl],
+                        [qr_matrices[uri] for uri in uris[sl]])
+
+        total_cards = total_songs
+    else:
+        # Streaming mode: pull one sheet's worth of songs at a time and
+        # drop them once drawn, keeping memory bounded
+        song_iter = iter(songs)
+        total_cards = 0
+
+        while True:
+            batch = list(islice(song_iter, cards_per_page))
+            if not batch:
+                break
+
+            batch_start = total_cards
+            print(f"  Generating cards {batch_start + 1}-{batch_start + len(batch)}...")
+
+            batch_years = [s.year for s in batch]
+            qr_matrices = build_qr_matrices(s.spotify_uri for s in batch)
+            _draw_sheet(
+                c, grid, batch_start,
+                batch_years,
+                [_fit_text(s.title, *_TITLE_FONT, _TITLE_MAX_WIDTH) for s in batch],
+                [_fit_text(s.artist, *_ARTIST_FONT, _ARTIST_MAX_WIDTH) for s in batch],
+                compute_themes(batch_years),
+                [qr_matrices[s.spotify_uri] for s in batch],
+            )
+
+            total_cards += len(batch)
+
     c.save()
-    print(f"\nGenerated {len(songs)} cards in {output_path}")
+
+    # getbuffer() avoids the extra copy getvalue() would make
+    with open(output_path, 'wb') as f:
+        f.write(pdf_buffer.getbuffer())
+
+    print(f"\nGenerated {total_cards} cards in {output_path}")
     print(f"Layout: {cols} columns x {rows} rows = {cards_per_page} cards per page")
-    print(f"Total pages: {((len(songs) - 1) // cards_per_page + 1) * 2} (front + back)")
+    print(f"Total pages: {((total_cards - 1) // cards_per_page + 1) * 2} (front + back)")
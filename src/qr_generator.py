@@ -1,42 +1,121 @@
 """QR code generator for Spotify URIs."""
 
+import copy
+from functools import lru_cache
+
 import qrcode
 from qrcode.image.pil import PilImage
 from PIL import Image
 from io import BytesIO
 
+try:
+    import segno
+    SEGNO_AVAILABLE = True
+except ImportError:
+    SEGNO_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _blank_qr(version: int, error_correction: int, box_size: int,
+              border: int) -> qrcode.QRCode:
+    """
+    Blank QRCode template for a given parameter set, built once.
+
+    Callers deepcopy the template instead of re-running QRCode's
+    constructor and parameter validation for every code.
+    """
+    return qrcode.QRCode(
+        version=version,
+        error_correction=error_correction,
+        box_size=box_size,
+        border=border,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _render_qr(data: str, size: int, inverted: bool) -> Image.Image:
+    """
+    Render the QR image for (data, size, inverted), memoized.
+
+    Decks routinely repeat tracks across printings, so identical inputs
+    skip data encoding, mask scoring and rasterization entirely on
+    repeat calls.
+    """
+    qr = copy.deepcopy(_blank_qr(1, qrcode.constants.ERROR_CORRECT_M, 10, 2))
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    # Render at (close to) the target size directly instead of always
+    # rasterizing at box_size=10 and Lanczos-resampling - the resize was
+    # by far the most expensive step, and pointless for a two-color image
+    modules_count = qr.modules_count + 2 * qr.border
+    qr.box_size = max(1, size // modules_count)
+
+    if inverted:
+        # White QR code on transparent background
+        img = qr.make_image(fill_color="white", back_color="transparent").convert("RGBA")
+    else:
+        img = qr.make_image(fill_color="black", back_color="white")
+
+    if img.size != (size, size):
+        # Snap to the exact requested size; NEAREST keeps the modules'
+        # hard edges (no quality loss on a binary image)
+        img = img.resize((size, size), Image.Resampling.NEAREST)
+
+    return img
+
 
 def generate_qr_code(data: str, size: int = 200, inverted: bool = False) -> Image.Image:
     """
     Generate a QR code image for the given data.
-    
+
     Args:
         data: The data to encode in the QR code (e.g., spotify:track:xxx)
         size: The desired size of the QR code in pixels
         inverted: If True, generate white QR on transparent background
-        
+
     Returns:
         PIL Image object containing the QR code
     """
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=10,
-        border=2,
-    )
+    return _render_qr(data, size, inverted)
+
+
+@lru_cache(maxsize=4096)
+def get_qr_matrix(data: str) -> tuple:
+    """
+    Compute the QR module matrix for the given data, memoized.
+
+    Returns the matrix including the quiet-zone border as a tuple of row
+    tuples of bools (True = dark module), top row first. Vector renderers
+    draw the modules as filled rectangles directly, skipping
+    rasterization entirely and staying sharp at any print size.
+
+    Uses segno when available - its module placement and mask scoring
+    run several times faster than qrcode's - and falls back to qrcode
+    otherwise. Both backends produce the same matrix shape.
+    """
+    border = 2
+
+    if SEGNO_AVAILABLE:
+        # segno's matrix has no quiet zone, so pad it to match qrcode's
+        # get_matrix output. micro=False keeps short payloads from
+        # becoming Micro QR codes, which many scanners can't read and
+        # the qrcode fallback never produces
+        qr = segno.make(data, error='m', micro=False)
+        core = [tuple(bool(v) for v in row) for row in qr.matrix]
+        width = len(core[0]) + 2 * border
+        blank = (False,) * width
+        pad = (False,) * border
+        rows = [blank] * border
+        rows.extend(pad + row + pad for row in core)
+        rows.extend([blank] * border)
+        return tuple(rows)
+
+    qr = copy.deepcopy(_blank_qr(1, qrcode.constants.ERROR_CORRECT_M, border=border,
+                                 box_size=10))
     qr.add_data(data)
     qr.make(fit=True)
-    
-    if inverted:
-        # White QR code on transparent background
-        img = qr.make_image(fill_color="white", back_color="transparent").convert("RGBA")
-    else:
-        img = qr.make_image(fill_color="black", back_color="white")
-    
-    # Resize to desired size
-    img = img.resize((size, size), Image.Resampling.LANCZOS)
-    
-    return img
+    return tuple(tuple(row) for row in qr.get_matrix())
 
 
 def generate_spotify_qr(spotify_uri: str, size: int = 200, inverted: bool = False) -> Image.Image:
@@ -1,8 +1,11 @@
 """Spotify playlist importer - fetches tracks from a Spotify playlist."""
 
 import csv
+import logging
 import re
 import os
+import shelve
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -13,11 +16,17 @@ try:
 except ImportError:
     SPOTIPY_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Compiled once at import so repeated calls skip re-parsing the patterns
+_ID_RE = re.compile(r'^[a-zA-Z0-9]{22}$')
+_URL_RE = re.compile(r'spotify\.com/playlist/([a-zA-Z0-9]+)')
+
 
 def extract_playlist_id(playlist_url: str) -> str:
     """
     Extract the playlist ID from a Spotify playlist URL.
-    
+
     Supports formats:
     - https://open.spotify.com/playlist/0Dsp6i8lvmcTg5aiusjnFH
     - https://open.spotify.com/playlist/0Dsp6i8lvmcTg5aiusjnFH?si=...
@@ -25,19 +34,18 @@ def extract_playlist_id(playlist_url: str) -> str:
     - 0Dsp6i8lvmcTg5aiusjnFH (just the ID)
     """
     # If it's already just an ID (alphanumeric, 22 chars)
-    if re.match(r'^[a-zA-Z0-9]{22}$', playlist_url):
+    if _ID_RE.match(playlist_url):
         return playlist_url
-    
+
     # Handle spotify URI format
     if playlist_url.startswith('spotify:playlist:'):
         return playlist_url.split(':')[-1]
-    
+
     # Handle URL format
-    pattern = r'spotify\.com/playlist/([a-zA-Z0-9]+)'
-    match = re.search(pattern, playlist_url)
+    match = _URL_RE.search(playlist_url)
     if match:
         return match.group(1)
-    
+
     raise ValueError(f"Could not extract playlist ID from: {playlist_url}")
 
 
@@ -73,40 +81,115 @@ def get_spotify_client(client_id: Optional[str] = None, client_secret: Optional[
     return spotipy.Spotify(auth_manager=auth_manager)
 
 
-def fetch_playlist_tracks(playlist_url: str, client_id: Optional[str] = None, 
+# Persistent playlist cache location; entries are keyed by playlist ID
+# and validated against Spotify's snapshot_id, so unchanged playlists
+# skip the track fetch entirely on re-runs
+_CACHE_DIR = Path.home() / '.cache' / 'hitster'
+
+
+def _open_playlist_cache() -> Optional[shelve.Shelf]:
+    """Open the on-disk playlist cache, or return None if unavailable."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(_CACHE_DIR / 'playlists'))
+    except Exception:
+        # A broken or unwritable cache should never block an import; a
+        # corrupted dbm file can surface as more than just OSError
+        return None
+
+
+def fetch_playlist_tracks(playlist_url: str, client_id: Optional[str] = None,
                           client_secret: Optional[str] = None) -> List[dict]:
     """
     Fetch all tracks from a Spotify playlist.
-    
+
+    Results are cached on disk per playlist; when Spotify reports the
+    same snapshot_id as the cached run, the cached tracks are returned
+    without re-fetching.
+
     Args:
         playlist_url: Spotify playlist URL or ID
         client_id: Spotify API client ID (optional if env var set)
         client_secret: Spotify API client secret (optional if env var set)
-        
+
     Returns:
         List of track dictionaries with title, artist, year, spotify_url
     """
     sp = get_spotify_client(client_id, client_secret)
     playlist_id = extract_playlist_id(playlist_url)
-    
-    tracks = []
-    offset = 0
+
+    # snapshot_id changes whenever the playlist's contents change, so one
+    # cheap metadata request can validate the whole cache entry
+    snapshot_id = sp.playlist(playlist_id, fields='snapshot_id').get('snapshot_id')
+
+    cache = _open_playlist_cache()
+    if cache is None:
+        return _fetch_all_tracks(sp, playlist_id)
+
+    # Every cache interaction is guarded: a corrupted entry falls back to
+    # a fresh fetch, a failed write is dropped, and the shelf is closed
+    # even when the fetch itself raises
+    try:
+        try:
+            cached = cache.get(playlist_id)
+        except Exception:
+            cached = None
+        if cached and snapshot_id and cached.get('snapshot_id') == snapshot_id:
+            tracks = cached['tracks']
+            logger.info("Playlist unchanged - using %d cached tracks", len(tracks))
+            return tracks
+
+        tracks = _fetch_all_tracks(sp, playlist_id)
+
+        if snapshot_id:
+            try:
+                cache[playlist_id] = {'snapshot_id': snapshot_id, 'tracks': tracks}
+            except Exception:
+                logger.debug("Could not update the playlist cache", exc_info=True)
+        return tracks
+    finally:
+        try:
+            cache.close()
+        except Exception:
+            pass
+
+
+def _fetch_all_tracks(sp: 'spotipy.Spotify', playlist_id: str) -> List[dict]:
+    """Fetch and parse every track of a playlist from the Spotify API."""
     limit = 100  # Max allowed by Spotify API
-    
-    print(f"Fetching tracks from playlist...")
-    
-    while True:
-        results = sp.playlist_tracks(
-            playlist_id,
-            offset=offset,
-            limit=limit,
-            fields='items(track(id,name,artists,album(release_date),external_urls)),total'
-        )
-        
-        items = results.get('items', [])
-        if not items:
-            break
-            
+    fields = 'items(track(id,name,artists,album(release_date),external_urls)),total'
+
+    logger.info("Fetching tracks from playlist...")
+
+    # First page tells us the playlist size; the remaining offsets are
+    # independent requests, so fan them out across threads instead of
+    # paying one network round trip per 100 tracks. spotipy blocks on
+    # each HTTP call and already retries 429s honoring Retry-After, so
+    # threads simply overlap the latency.
+    first = sp.playlist_tracks(playlist_id, offset=0, limit=limit, fields=fields)
+    total = first.get('total', 0)
+    pages = [first.get('items', [])]
+
+    offsets = range(limit, total, limit)
+    if offsets:
+        def fetch_page(offset: int) -> list:
+            results = sp.playlist_tracks(playlist_id, offset=offset,
+                                         limit=limit, fields=fields)
+            return results.get('items', [])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # executor.map preserves offset order, so tracks stay in
+            # playlist order
+            pages.extend(executor.map(fetch_page, offsets))
+
+    # total is known up front, so preallocate instead of growing through
+    # append's occasional reallocations; skipped items (local files,
+    # missing URLs) leave slack that the final slice trims off
+    tracks: List[dict] = [None] * total
+    write_idx = 0
+    fetched = 0
+
+    for items in pages:
         for item in items:
             track = item.get('track')
             if not track:  # Skip if track is None (can happen with local files)
@@ -130,21 +213,24 @@ def fetch_playlist_tracks(playlist_url: str, client_id: Optional[str] = None,
             spotify_url = external_urls.get('spotify', '')
             
             if spotify_url:  # Only add if we have a valid URL
-                tracks.append({
+                tracks[write_idx] = {
                     'title': title,
                     'artist': artist,
                     'year': year,
                     'spotify_url': spotify_url
-                })
-        
-        offset += limit
-        total = results.get('total', 0)
-        print(f"  Fetched {min(offset, total)}/{total} tracks...")
-        
-        if offset >= total:
-            break
-    
-    print(f"Successfully fetched {len(tracks)} tracks!")
+                }
+                write_idx += 1
+
+        fetched += len(items)
+        # Progress every few pages is plenty; per-page prints flush the
+        # stream once per 100 tracks for no benefit
+        if fetched % 500 == 0 or fetched >= total:
+            logger.info("  Fetched %d/%d tracks...", min(fetched, total), total)
+
+    if write_idx < total:
+        tracks = tracks[:write_idx]
+
+    logger.info("Successfully fetched %d tracks!", len(tracks))
     return tracks
 
 
@@ -156,11 +242,17 @@ def save_tracks_to_csv(tracks: List[dict], output_path: Path):
         tracks: List of track dictionaries
         output_path: Path to save the CSV file
     """
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['title', 'artist', 'year', 'spotify_url'])
-        writer.writeheader()
-        writer.writerows(tracks)
-    
+    # csv.writer over pre-extracted tuples skips DictWriter's per-row
+    # fieldname lookups; the 1 MB buffer batches the disk writes
+    with open(output_path, 'w', newline='', encoding='utf-8',
+              buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(['title', 'artist', 'year', 'spotify_url'])
+        writer.writerows(
+            (t['title'], t['artist'], t['year'], t['spotify_url'])
+            for t in tracks
+        )
+
     print(f"Saved {len(tracks)} tracks to {output_path}")
 
 